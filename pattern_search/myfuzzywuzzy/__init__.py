@@ -1,2 +0,0 @@
-# -*- coding: utf-8 -*-
-__version__ = '0.17.0'
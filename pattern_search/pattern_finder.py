@@ -15,8 +15,16 @@ in a variety of ways, etc.)
 import argparse
 import textwrap
 import re
-from myfuzzywuzzy import fuzz
-from myfuzzywuzzy import process
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from rapidfuzz import fuzz
+from rapidfuzz import process
+from rapidfuzz import utils
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 
 
@@ -71,86 +79,333 @@ def normalize(s):
     norm_s = s.lower().strip('\n')
     return norm_s
 
+'''
+The corpus is kept as one string plus an array of line start offsets instead
+of a list of line strings: 8 bytes of index per line, and a line is only
+turned into a string when it is needed.
+'''
+Corpus = namedtuple('Corpus', ['text', 'starts', 'norm_text', 'norm_starts'])
+
+def load_corpus(path):
+    '''Read the corpus in one go and index its lines. The whole text is
+    lowercased in a single call instead of calling normalize() once per line.'''
+    with open(path,'r') as f:
+        text = f.read()
+    norm_text = text.lower()
+    norm_starts = line_starts(norm_text)
+    # lower() changes the length of a few characters (e.g. U+0130), in which
+    # case the original text needs its own index.
+    starts = norm_starts if len(text) == len(norm_text) else line_starts(text)
+    return Corpus(text, starts, norm_text, norm_starts)
+
+def line_starts(text):
+    '''Return the offset at which each line of text (str or bytes) starts,
+    followed by the offset just past the newline ending the last line.'''
+    newline = b'\n' if isinstance(text, bytes) else '\n'
+    starts = array('q', [0])
+    pos = text.find(newline)
+    while pos != -1:
+        starts.append(pos+1)
+        pos = text.find(newline, pos+1)
+    if text and not text.endswith(newline):
+        starts.append(len(text)+1)
+    return starts
+
+def get_line(text, starts, i):
+    return text[starts[i]:starts[i+1]-1]
+
+def iter_lines(text, starts):
+    for i in range(len(starts)-1):
+        yield get_line(text, starts, i)
+
 # MATCHING FUNCTIONS ##########################################################
 
 '''
-The pattern to match is the entire sentence.
+The pattern to match is the entire sentence. It is a plain literal: a line
+matches when it is equal to it, so no regex is needed.
 '''
 def get_sentences_pattern(string, indices):
-    return r'^'+string[indices[0]:indices[1]+1]+r'$'
+    return string[indices[0]:indices[1]+1]
 
 '''
-The pattern to match is one or more contiguous words.
+The pattern to match is one or more contiguous words. It is a plain literal:
+wordsMatch checks the word boundaries around it itself, and only builds the
+regex for very frequent short words.
 '''
 def get_words_pattern(string, indices, fuzzy=False):
-    substr = re.escape(string[indices[0]:indices[1]+1])
-    pattern = r'\b'+substr+r'\b' if not fuzzy else substr # \b is word boundary
-    return pattern
+    return string[indices[0]:indices[1]+1]
+
+def get_words_regex(words):
+    return r'\b'+re.escape(words)+r'\b'
 
 '''
-The pattern to match is one or more contiguous morphemes.
+The pattern to match is one or more contiguous morphemes, i.e. the substring
+with no word boundary on at least one side. morphemesMatch builds the regex.
 '''
 def get_morphemes_pattern(string, indices, fuzzy=False):
-    substr = re.escape(string[indices[0]:indices[1]+1])
-    pattern = r'\B'+substr+'|'+substr+r'\B' if not fuzzy else substr
-    return pattern
+    return string[indices[0]:indices[1]+1]
+
+def get_morphemes_regex(morphemes):
+    substr = re.escape(morphemes)
+    return r'\B'+substr+'|'+substr+r'\B'
 
 '''
-The pattern to match is a discontinuous span.
+The pattern to match is a discontinuous span, given as the list of its
+substrings. discontMatch finds the lines containing all of them in order.
 '''
-def get_discont_span_pattern(string, list_of_index_pairs,fuzzy=False):
+def get_discont_span_pattern(string, list_of_index_pairs):
     substrs = []
     for pair in list_of_index_pairs:
         substrs.append(string[pair[0]:pair[1]+1])
-    if not fuzzy:
-        pattern = ''
-        for s in substrs:
-            pattern += r'.*('+re.escape(s)+')'
-        return r''+pattern+r'.*'
     return substrs
 
 
 def simpleMatch(corpus, pattern):
-    results = []
-    regex = re.compile(r''+pattern,re.I)
-    for ln in corpus:
-        norm_ln = normalize(ln)
-        matches = list(re.finditer(regex, norm_ln))
-        if matches:
-            match_spans = []
-            for m in matches:
-                for span in m.regs:
-                    match_spans.append(span)
-            results.append((norm_ln,100))
-            print(norm_ln)
-    return results
+    '''Yield (line index, match spans) for every line matching the pattern,
+    in corpus order.'''
+    # The pattern is compiled case-sensitive: it is built from the normalized
+    # query and run over the normalized corpus, so case folding at every
+    # comparison would be wasted work (and would turn off re's literal
+    # prefilter).
+    regex = re.compile(pattern)
+    # Run the regex once over the whole corpus instead of once per line and
+    # map each match back to the line it starts on. None of the patterns can
+    # match a newline, so a match never spans two lines.
+    buf, starts = corpus.norm_text, corpus.norm_starts
+    nlines = len(starts) - 1
+    line, match_spans = None, []
+    for m in regex.finditer(buf):
+        i = bisect_right(starts, m.start()) - 1
+        if i >= nlines:
+            # an empty match at the very end of a corpus ending in a newline
+            break
+        if i != line:
+            if match_spans:
+                yield line, match_spans
+            line, match_spans = i, []
+        offset = starts[i]
+        for g in range(regex.groups+1):
+            start, end = m.span(g)
+            match_spans.append((start-offset, end-offset) if start >= 0 else (start, end))
+    if match_spans:
+        yield line, match_spans
+
+
+def discont_spans(text, substrs, start=0, end=None):
+    '''Return the spans of the first occurrences of substrs, in order and
+    without overlapping, in text[start:end], or None if there are none.'''
+    spans = []
+    for sub in substrs:
+        start = text.find(sub, start, end)
+        if start == -1:
+            return None
+        spans.append((start, start+len(sub)))
+        start += len(sub)
+    return spans
+
+def findDiscontMatch(corpus, substrs):
+    '''Yield (line index, substring spans) for every line containing the
+    substrings in order.
+
+    Only lines containing the first substring are looked at: from its first
+    occurrence, the others are searched for in order with str.find, which
+    is linear in the length of the line whatever the substrings are.'''
+    buf, starts = corpus.norm_text, corpus.norm_starts
+    nlines = len(starts) - 1
+    # the substrings cannot overlap, so they need at least this many
+    # characters from the first one's occurrence to the end of the line
+    min_len = sum(len(sub) for sub in substrs)
+    pos = buf.find(substrs[0])
+    while pos != -1:
+        i = bisect_right(starts, pos) - 1
+        if i >= nlines:
+            break
+        line_end = starts[i+1] - 1
+        if line_end - pos < min_len:
+            spans = None
+        else:
+            spans = discont_spans(buf, substrs, pos, line_end)
+        if spans:
+            yield i, [(start-starts[i], end-starts[i]) for start, end in spans]
+        pos = buf.find(substrs[0], line_end+1)
+
+def encode_text(text):
+    '''Return text as bytes along with the encoding used. Latin-1 is used
+    whenever every character fits in it: like CPython's own one-byte str
+    storage, it keeps one byte per character, so offsets into the bytes are
+    offsets into text and no UTF-8 multi-byte sequences are scanned.'''
+    try:
+        return text.encode('latin-1'), 'latin-1'
+    except UnicodeEncodeError:
+        return text.encode('utf-8'), 'utf-8'
+
+def hyperscanDiscontMatch(corpus, substrs):
+    '''Yield (line index, substring spans) for every line containing the
+    substrings in order, in a single Hyperscan pass over the whole corpus.'''
+    data, encoding = encode_text(corpus.norm_text)
+    try:
+        encoded = [sub.encode(encoding) for sub in substrs]
+    except UnicodeEncodeError:
+        # a character that does not occur anywhere in the corpus
+        return
+    # with one byte per character the line offsets are byte offsets too
+    starts = corpus.norm_starts if encoding == 'latin-1' else line_starts(data)
+    # Hyperscan compiles s1.*s2.* ... into an automaton that never backtracks;
+    # . does not match newlines, so a match never spans two lines. Both the
+    # corpus and the substrings are normalized, so the match is case-sensitive.
+    expression = b'.*'.join(re.escape(sub) for sub in encoded)
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(expressions=[expression], ids=[0], elements=1, flags=[0])
+    # Hyperscan reports every end offset of a match, and the scan cannot be
+    # paused to yield, so the callback keeps only the first one on each line.
+    lines = []
+    line_end = -1
+    def on_match(id, start, end, flags, context):
+        nonlocal line_end
+        if end <= line_end:
+            return
+        i = bisect_right(starts, end-1) - 1
+        line_end = starts[i+1]
+        lines.append(i)
+    db.scan(data, match_event_handler=on_match)
+
+    for i in lines:
+        ln = get_line(corpus.norm_text, corpus.norm_starts, i)
+        yield i, discont_spans(ln, substrs)
+
+def discontMatch(corpus, substrs):
+    '''Yield (line index, match spans) for every line containing the
+    substrings in order.'''
+    if hyperscan is None or not all(substrs):
+        return findDiscontMatch(corpus, substrs)
+    return hyperscanDiscontMatch(corpus, substrs)
+
+
+# WORD_CHARS[c] is 1 if the character with code point c < 256 is a word
+# character in the sense of the regex \b (alphanumeric or underscore).
+WORD_CHARS = bytes(1 if chr(c).isalnum() or c == ord('_') else 0 for c in range(256))
+
+# Above this many occurrences per character of corpus (e.g. a one-letter word
+# like 'i'), checking the boundaries of each occurrence in Python costs more
+# than a single regex pass; only words of up to DENSE_WORDS_MAX_LEN characters
+# can be that frequent, so longer ones are not counted.
+DENSE_WORDS_RATIO = 1/20
+DENSE_WORDS_MAX_LEN = 2
+
+def is_word_char(c):
+    o = ord(c)
+    return WORD_CHARS[o] == 1 if o < 256 else (c.isalnum() or c == '_')
+
+def wordsMatch(corpus, words):
+    '''Yield (line index, match spans) for every line where words occurs
+    between word boundaries, like the regex \\bwords\\b would find it.
+
+    The occurrences are found with str.find, which skips ahead with memchr,
+    and only the characters on either side of each one are looked up.'''
+    buf, starts = corpus.norm_text, corpus.norm_starts
+    # an empty selection keeps the regex's meaning: \b\b matches at every
+    # word boundary
+    if not words or (len(words) <= DENSE_WORDS_MAX_LEN
+                     and buf.count(words) > len(buf) * DENSE_WORDS_RATIO):
+        yield from simpleMatch(corpus, get_words_regex(words))
+        return
+    # there is a word boundary where exactly one of the two characters around
+    # it is a word character
+    first_is_word = is_word_char(words[0])
+    last_is_word = is_word_char(words[-1])
+    line, match_spans = None, []
+    pos = buf.find(words)
+    while pos != -1:
+        end = pos + len(words)
+        before = pos > 0 and is_word_char(buf[pos-1])
+        after = end < len(buf) and is_word_char(buf[end])
+        if before != first_is_word and after != last_is_word:
+            i = bisect_right(starts, pos) - 1
+            if i != line:
+                if match_spans:
+                    yield line, match_spans
+                line, match_spans = i, []
+            match_spans.append((pos-starts[i], end-starts[i]))
+            pos = buf.find(words, end)
+        else:
+            pos = buf.find(words, pos+1)
+    if match_spans:
+        yield line, match_spans
+
+def prefilterMatch(corpus, literal, regex):
+    '''Yield (line index, match spans) for every line matching regex, where
+    every match of regex starts with literal.
+
+    Candidates are found with str.find, which skips ahead with memchr, and
+    the regex only runs at those offsets instead of over every character.'''
+    buf, starts = corpus.norm_text, corpus.norm_starts
+    line, match_spans = None, []
+    pos = buf.find(literal)
+    while pos != -1:
+        m = regex.match(buf, pos)
+        if m:
+            i = bisect_right(starts, pos) - 1
+            if i != line:
+                if match_spans:
+                    yield line, match_spans
+                line, match_spans = i, []
+            for g in range(regex.groups+1):
+                start, end = m.span(g)
+                if start >= 0:
+                    start, end = start-starts[i], end-starts[i]
+                match_spans.append((start, end))
+            pos = buf.find(literal, max(m.end(), pos+1))
+        else:
+            pos = buf.find(literal, pos+1)
+    if match_spans:
+        yield line, match_spans
+
+def morphemesMatch(corpus, morphemes):
+    '''Yield (line index, match spans) for every line containing morphemes
+    without a word boundary on at least one side.'''
+    if not morphemes:
+        return simpleMatch(corpus, get_morphemes_regex(morphemes))
+    return prefilterMatch(corpus, morphemes, re.compile(get_morphemes_regex(morphemes)))
+
+
+def sentenceMatch(corpus, sentence):
+    buf, starts = corpus.norm_text, corpus.norm_starts
+    nlines = len(starts) - 1
+    # A line matches when an occurrence of the sentence starts and ends on
+    # line boundaries.
+    pos = buf.find(sentence)
+    while pos != -1:
+        end = pos + len(sentence)
+        if (pos == 0 or buf[pos-1] == '\n') and (end == len(buf) or buf[end] == '\n'):
+            i = bisect_right(starts, pos) - 1
+            # an empty sentence is also found at the very end of a corpus
+            # ending in a newline, after its last line
+            if i >= nlines:
+                break
+            print(get_line(buf, starts, i))
+            yield i, 100
+            end += 1
+        else:
+            end = pos + 1
+        pos = buf.find(sentence, end)
 
 
 def fuzzyMatch(corpus, pattern):
-    matches = []
-    for ln in corpus:
-        score = compareLine(ln,pattern)
-        # partialRatioResult returns the same number as partialRatio but also the indices
-        # of where the match was found.
-        #partialRatioResult = fuzz.custom_get_blocks(pattern,norm_ln)
-        #tokenSetRatio = fuzz.token_set_ratio(pattern, norm_ln)
-
-        if score >= 80:
-            matches.append((ln,score))
-            print(score, ln.strip('\n'))
-
-    #    elif tokenSetRatio >= 80:
-    #        print("----------- token set ratio ------------")
-    #        matches.append(ln)
-    #        print(tokenSetRatio, norm_ln.strip('\n'))
-            
-    return matches
-
-def tryProcess(corpus, pattern):
-    ''' process module from fuzzywuzzy -seems to score differently from partialRatio & tokenSetRatio '''
-    print(len(corpus))
-    matches = process.extract(pattern, corpus)
-    print(matches)
+    # rapidfuzz scores every line against the pattern in C++ and only yields
+    # the lines (in corpus order) whose partial ratio is at least 80. The
+    # pattern's bit vectors are built once and each window of len(pattern)
+    # characters is scored with a bit-parallel (Hyyro/Myers) kernel. Every
+    # alignment of the pattern along the line gets a window, so a line still
+    # costs about len(line)*len(pattern) character comparisons; the kernel
+    # only cuts the constant, by comparing up to 64 characters per word.
+    # The lines come from the normalized text, so they need no processor.
+    # Scores are rounded like fuzzywuzzy's were, so the cutoff is 79.5.
+    results = process.extract_iter(pattern, iter_lines(corpus.norm_text, corpus.norm_starts),
+                                   scorer=fuzz.partial_ratio, score_cutoff=79.5)
+    for _, score, i in results:
+        score = round(score)
+        print(score, get_line(corpus.text, corpus.starts, i))
+        yield i, score
 
 # SPLITTING and WEIGHTING FUNCTIONS ##########################################################
 
@@ -164,89 +419,117 @@ def split(sentence, idcs):
     return [block, rest_of_line]
 
 def compareLines(unselected_corpus_line, unselected_input):
+    # rapidfuzz does no preprocessing by default; default_process lowercases
+    # and strips punctuation like fuzzywuzzy's full_process did. Unlike
+    # full_process it keeps non-ASCII characters: force_ascii deleted the
+    # accented vowels of Arapaho words. Scores are rounded to ints as
+    # fuzzywuzzy returned them.
     #do not penalize free word order
-    token_score = fuzz.token_sort_ratio(unselected_corpus_line, unselected_input)
+    token_score = round(fuzz.token_sort_ratio(unselected_corpus_line, unselected_input,
+                                              processor=utils.default_process))
     #do not penalize repetitions
-    set_score = fuzz.token_set_ratio(unselected_corpus_line, unselected_input)
+    set_score = round(fuzz.token_set_ratio(unselected_corpus_line, unselected_input,
+                                           processor=utils.default_process))
     return (token_score/2) + (set_score)/2
 
 def weightedSimplematch(split_corpusline, split_queryline):
     '''Matches query to matched block and rest of sentences to each other'''
-    selected_score = fuzz.ratio(split_corpusline[0], split_queryline[0])
-    if selected_score < 100:
+    # only identical blocks score 100, so no need to compute the ratio
+    if split_corpusline[0] != split_queryline[0]:
         return 0
+    selected_score = 100
     unselected_score = compareLines(split_corpusline[1], split_queryline[1])
     return weight(selected_score, unselected_score)
 
+SELECTED_WEIGHT = .75
+UNSELECTED_WEIGHT = .25
+
 def weight(selected_match_score, unselected_match_score):
     '''Takes similar scores for substring/subword units.
     Gives higher weights to selected subunit.
     Returns combined score.'''
-    selected_weight = .75
-    unselected_weight = .25
-    weight1 = selected_match_score * selected_weight
-    weight2 = unselected_match_score * unselected_weight
+    weight1 = selected_match_score * SELECTED_WEIGHT
+    weight2 = unselected_match_score * UNSELECTED_WEIGHT
     return weight1 + weight2
 
-def weightedFuzzymatch(split_corpusline, split_queryline):
-    selected_score = fuzz.ratio(split_corpusline[0], split_queryline[0])
-    unselected_score = compareLine(split_corpusline[1], split_queryline[1])
+def weightedFuzzymatch(split_corpusline, split_queryline, score_cutoff=0):
+    '''Returns 0 without scoring the rest of the line when the selected
+    block alone cannot reach score_cutoff.'''
+    # the rest of the line contributes at most 100 * UNSELECTED_WEIGHT
+    selected_cutoff = max(0, (score_cutoff - 100*UNSELECTED_WEIGHT) / SELECTED_WEIGHT)
+    # rounded like fuzzywuzzy's ratio, so anything that rounds up to the
+    # cutoff has to be scored
+    selected_score = round(fuzz.ratio(split_corpusline[0], split_queryline[0],
+                                      score_cutoff=max(0, selected_cutoff-.5)))
+    if selected_score < selected_cutoff:
+        return 0
+    unselected_score = compareLines(split_corpusline[1], split_queryline[1])
     return weight(selected_score, unselected_score)
 
-def weightedMatch(corpus, input_string, query, fuzzy):
+def weightedMatch(corpus, input_string, string, indices, fuzzy, matcher=simpleMatch):
     '''split, match splits, and weight score.
-    Returns list of match sentences'''
-    weighted_matches = []
+    string is the normalized sentence input_string was selected from, and
+    indices the (inclusive) pair it was selected with.
+    Yields (line index, score) for each match sentence'''
     if fuzzy:
-        split_string = split(input_string, get_indices(args)[0])
+        if isinstance(input_string, list):
+            input_string = ' '.join(input_string)
+        # split() takes an exclusive end
+        split_string = split(string, (indices[0], indices[1]+1))
         #[(corpus line, ratio, (matched_block_indices))]
-        for ln in corpus:
-            partial_match = fuzz.custom_get_blocks(ln,query)
-            if partial_match[0] >= 50:
-                split_line = split(ln, match[1])
-                weighted_score = weightedFuzzymatch(split_line, split_string)
+        for i, ln in enumerate(iter_lines(corpus.norm_text, corpus.norm_starts)):
+            # Lines are aligned against the selected substring itself. With a
+            # score_cutoff rapidfuzz stops aligning as soon as the line cannot
+            # reach it, and returns None.
+            partial_match = fuzz.partial_ratio_alignment(ln,input_string,score_cutoff=50)
+            if partial_match is not None:
+                split_line = split(ln, (partial_match.src_start, partial_match.src_end))
+                weighted_score = weightedFuzzymatch(split_line, split_string, 60)
                 if weighted_score >= 60:
-                    weighted_matches.append((ln, weighted_score))
+                    yield i, weighted_score
     else:
-        span_matches = simpleMatch(corpus, input_string)
-        for match in span_matches:
-            line_similarity = compareLine(input_string, span_matches[0])
-            weighted_score = weight(match[1],line_similarity)
+        span_matches = matcher(corpus, input_string)
+        if isinstance(input_string, list):
+            # the line is scored against the substrings joined by spaces
+            input_string = ' '.join(input_string)
+        for i, match_spans in span_matches:
+            ln = get_line(corpus.norm_text, corpus.norm_starts, i)
+            line_similarity = compareLines(input_string, ln)
+            weighted_score = weight(100,line_similarity)
             if weighted_score >= 80:
-                weighted_matches.append((span_matches[0],weighted_score))
-                print(weighted_score, match[0].strip('\n'))
-
-    return weighted_matches
+                print(weighted_score, ln)
+                yield i, weighted_score
 
 # MAIN FUNCTIONS ##############################################################
 '''
-Return a list of sentences where a match was found.
+Write the sentences where a match was found as they are found, and return
+how many there were.
 '''
 def main(args):
-    with open(args.corpus,'r') as f:
-        corpus = f.readlines()
+    corpus = load_corpus(args.corpus)
     indices = get_indices(args)
     s = normalize(args.string)
     if args.words:
         p = get_words_pattern(s,indices[0],args.fuzzy)
+        matcher = wordsMatch
     elif args.morphemes:
         p = get_morphemes_pattern(s,indices[0],args.fuzzy)
+        matcher = morphemesMatch
     elif args.discont:
-        p = get_discont_span_pattern(s,indices,args.fuzzy)
+        p = get_discont_span_pattern(s,indices)
+        matcher = discontMatch
     else:
         p = get_sentences_pattern(s,indices[0])
     if args.fuzzy:
         if args.sentence:
             matches = fuzzyMatch(corpus, p)
         else:
-            matches = weightedMatch(corpus, p, args.indices,args.fuzzy)
+            matches = weightedMatch(corpus, p, s, indices[0], args.fuzzy)
     else:
         if args.sentence:
-            matches = simpleMatch(corpus, p)
+            matches = sentenceMatch(corpus, p)
         else:
-            matches = weightedMatch(corpus, p, args.indices, fuzzy=False)
-#    print("testing process function from fuzzywuzzy")
-#    tryProcess(corpus, s)
+            matches = weightedMatch(corpus, p, s, indices[0], fuzzy=False, matcher=matcher)
     # matches = []
     # for ln in corpus:
     #     norm_ln = normalize(ln)
@@ -254,13 +537,19 @@ def main(args):
     #     if match:
     #         matches.append(ln)
     #         print(norm_ln.strip('\n'))
-    if len(matches) == 0:
+    n = 0
+    out = open(args.output, 'w') if args.output else None
+    try:
+        for i, score in matches:
+            n += 1
+            if out:
+                out.write(get_line(corpus.text, corpus.starts, i)+'\n')
+    finally:
+        if out:
+            out.close()
+    if n == 0:
         print(NO_MATCH)
-    if args.output:
-        with open(args.output, 'w') as f:
-            for m in matches:
-                f.write(m[0])
-    return matches
+    return n
 
 # SCRIPT ENTRYPOINT ###########################################################
 
@@ -2,7 +2,6 @@
 import collections
 import argparse
 import textwrap
-import myfuzzywuzzy
 from pattern_finder import compareLines
 
 # RANKING